@@ -2,34 +2,40 @@ import board
 import displayio
 import framebufferio
 import rgbmatrix
-from adafruit_display_text import label
+from adafruit_display_text import bitmap_label
 from adafruit_bitmap_font import bitmap_font
 import terminalio
+import vectorio
 import time
-import os
-import json
 import gc
 
 # Release any displays
 displayio.release_displays()
 
 # --- Load Configuration ---
+# Parsed colors keyed by their layout string; layouts repeat a few values
+_hex_cache = {}
+
 def hex_to_int(hex_str):
     """Convert a hex string (with or without 0x prefix) to an integer."""
     if isinstance(hex_str, int):
         return hex_str
-    if hex_str.startswith("0x"):
-        return int(hex_str, 16)
-    return int(hex_str, 16)
+    value = _hex_cache.get(hex_str)
+    if value is None:
+        value = int(hex_str, 16)
+        _hex_cache[hex_str] = value
+    return value
 
 def load_layout_config():
     """Load the layout configuration file for the display"""
+    import json  # Only needed once, at startup
+    
     try:
         with open("/layouts/w64h32.json", "r") as f:
             config = json.load(f)
             print("Layout configuration loaded successfully")
             return config
-    except Exception as e:
+    except (OSError, ValueError) as e:
         print("Error loading layout configuration:", e)
         # Default configuration if file is missing - updated for 15x15 logo
         return {
@@ -57,6 +63,21 @@ WIDTH = 64
 HEIGHT = 32
 BIT_DEPTH = 4
 
+# Width of one terminalio.FONT glyph in pixels (the font is monospaced)
+TERMINALIO_CHAR_WIDTH = 6
+
+# --- Colors ---
+TEXT_COLOR = 0xFFFFFF
+HIGHLIGHT_COLOR = 0x00FFFF
+
+# Layout defaults for the base diamond (hex strings, as in the layout file)
+BASE_ON_COLOR = "0xFFFFFF"
+BASE_OFF_COLOR = "0x222222"
+HOME_PLATE_COLOR = "0x444444"
+
+# Only force a garbage collection when free heap drops below this (bytes)
+GC_FREE_THRESHOLD = 8192
+
 matrix = rgbmatrix.RGBMatrix(
     width=WIDTH,
     height=HEIGHT,
@@ -71,6 +92,7 @@ matrix = rgbmatrix.RGBMatrix(
     clock_pin=board.MTX_CLK,
     latch_pin=board.MTX_LAT,
     output_enable_pin=board.MTX_OE,
+    doublebuffer=True,  # Refresh from one buffer while the next frame is drawn
 )
 display = framebufferio.FramebufferDisplay(matrix)
 
@@ -98,18 +120,19 @@ def show_mlb_startup_logo():
     except Exception as e:
         print(f"Error loading MLB logo: {e}")
         # Create text as fallback
-        mlb_text = label.Label(terminalio.FONT, text="MLB", color=0x0000FF, scale=2)
-        mlb_text.x = (WIDTH - mlb_text.bounding_box[2]) // 2
-        mlb_text.y = HEIGHT // 2
+        # terminalio glyphs are fixed width, so the centered x is known up front
+        mlb_x = (WIDTH - len("MLB") * TERMINALIO_CHAR_WIDTH * 2) // 2
+        mlb_text = bitmap_label.Label(
+            terminalio.FONT, text="MLB", color=0x0000FF, scale=2, x=mlb_x, y=HEIGHT // 2
+        )
         startup_group.append(mlb_text)
     
     # Startup message
-    version_label = label.Label(
-        terminalio.FONT, 
-        text="MLB Scoreboard v1.1", 
-        color=0xFFFFFF, 
-        x=2, 
-        y=HEIGHT - 4
+    version_label = create_text_label(
+        "MLB Scoreboard v1.1",
+        TEXT_COLOR,
+        2,
+        HEIGHT - 4
     )
     startup_group.append(version_label)
     
@@ -117,8 +140,55 @@ def show_mlb_startup_logo():
     display.root_group = startup_group
     time.sleep(3)  # Show for 3 seconds
     
-    # Cleanup
-    gc.collect()
+    # Cleanup - skip the full collection unless the heap is getting tight
+    if gc.mem_free() < GC_FREE_THRESHOLD:
+        gc.collect()
+
+# --- Solid Color Rectangles ---
+# Single-color palettes keyed by color; shared, so never modify an entry
+_palette_cache = {}
+
+def get_solid_palette(color):
+    """Return a cached one-entry palette for the given color"""
+    palette = _palette_cache.get(color)
+    if palette is None:
+        palette = displayio.Palette(1)
+        palette[0] = color
+        _palette_cache[color] = palette
+    return palette
+
+def create_solid_rect(color, width, height, x=0, y=0):
+    """Create a solid color rectangle drawn by vectorio (no backing bitmap)"""
+    return vectorio.Rectangle(
+        pixel_shader=get_solid_palette(color),
+        width=width,
+        height=height,
+        x=x,
+        y=y
+    )
+
+# --- Text Labels ---
+def create_text_label(text, color, x, y):
+    """Create a plain (no padding, no background, scale 1) terminalio label"""
+    # bitmap_label renders into one bitmap instead of a TileGrid per glyph,
+    # and save_text=False skips keeping a second copy of the string
+    return bitmap_label.Label(
+        terminalio.FONT,
+        text=text,
+        color=color,
+        x=x,
+        y=y,
+        save_text=False
+    )
+
+def create_layout_label(text, element_config):
+    """Create a plain label positioned and colored by a layout config entry"""
+    return create_text_label(
+        text,
+        hex_to_int(element_config["color"]),
+        element_config["x"],
+        element_config["y"]
+    )
 
 # --- Draw Logo Border ---
 def draw_logo_border(main_group, layout):
@@ -126,37 +196,50 @@ def draw_logo_border(main_group, layout):
     if "logo_area" not in layout:
         return
     
-    # Create a rectangle bitmap for the border
-    border_width = layout["logo_area"]["width"]
-    border_height = layout["logo_area"]["height"]
-    border_bitmap = displayio.Bitmap(border_width, border_height, 2)
-    border_palette = displayio.Palette(2)
-    border_palette[0] = 0x000000  # Transparent/black
-    border_palette[1] = hex_to_int(layout["logo_area"]["border_color"])  # Border color
+    logo_area = layout["logo_area"]
+    border_x = logo_area["x"]
+    border_y = logo_area["y"]
+    border_width = logo_area["width"]
+    border_height = logo_area["height"]
+    border_color = hex_to_int(logo_area["border_color"])
     
-    # Draw the border (just the outline)
-    # Top and bottom edges
-    for x in range(border_width):
-        border_bitmap[x, 0] = 1  # Top edge
-        border_bitmap[x, border_height-1] = 1  # Bottom edge
+    # Draw the border (just the outline) as four 1-pixel edges
+    # Top and bottom edges span the full width
+    main_group.append(create_solid_rect(border_color, border_width, 1, x=border_x, y=border_y))
+    main_group.append(create_solid_rect(border_color, border_width, 1, x=border_x, y=border_y + border_height - 1))
     
-    # Left and right edges
-    for y in range(border_height):
-        border_bitmap[0, y] = 1  # Left edge
-        border_bitmap[border_width-1, y] = 1  # Right edge
-    
-    # Create a TileGrid for the border
-    border_grid = displayio.TileGrid(
-        border_bitmap, 
-        pixel_shader=border_palette,
-        x=layout["logo_area"]["x"],
-        y=layout["logo_area"]["y"]
-    )
+    # Left and right edges fill the height between them
+    side_height = border_height - 2
+    if side_height > 0:
+        main_group.append(create_solid_rect(border_color, 1, side_height, x=border_x, y=border_y + 1))
+        main_group.append(create_solid_rect(border_color, 1, side_height, x=border_x + border_width - 1, y=border_y + 1))
+
+# --- Draw Logo Panel ---
+def draw_logo_panel(main_group, layout):
+    """Draw the logo border and team logo shared by every display mode"""
+    draw_logo_border(main_group, layout)
     
-    # Add the border to the main group
-    main_group.append(border_grid)
+    try:
+        logo_config = layout["logo"]
+        logo_bitmap = displayio.OnDiskBitmap("/images/ATL.bmp")
+        logo_tilegrid = displayio.TileGrid(
+            logo_bitmap, 
+            pixel_shader=logo_bitmap.pixel_shader, 
+            x=logo_config["x"], 
+            y=logo_config["y"]
+        )
+        main_group.append(logo_tilegrid)
+    except Exception as e:
+        print("Error loading logo:", e)
 
 # --- Create Pixel-Based Diamond for Base Visualization ---
+# Shared read-only default for missing config sections (never mutate)
+_EMPTY = {}
+
+# Base color lookups indexed by the occupied flag (False=0, True=1)
+_BASE_COLOR_KEYS = ("color_off", "color_on")
+_BASE_COLOR_DEFAULTS = (BASE_OFF_COLOR, BASE_ON_COLOR)
+
 def create_base_diamond(main_group, first=False, second=False, third=False, layout=None):
     """Create a diamond-shaped base visualization using the layout configuration"""
     if not layout or "bases" not in layout:
@@ -166,12 +249,15 @@ def create_base_diamond(main_group, first=False, second=False, third=False, layo
     bases_config = layout["bases"]
     
     # Create a group for the bases
+    origin_x = bases_config.get("x", 0)
+    origin_y = bases_config.get("y", 0)
     base_group = displayio.Group()
-    base_group.x = bases_config.get("x", 0)
-    base_group.y = bases_config.get("y", 0)
+    base_group.x = origin_x
+    base_group.y = origin_y
     
     # Base size (diameter) - smaller for 15x15 layout
     base_size = 2
+    base_half = base_size // 2
     
     # Create bitmaps for each base
     for base_name, occupied in [
@@ -181,38 +267,27 @@ def create_base_diamond(main_group, first=False, second=False, third=False, layo
         ("home", False)  # Home plate is always shown but never "occupied"
     ]:
         # Get base configuration
-        base_config = bases_config.get(base_name, {})
-        base_x = base_config.get("x", 0) - base_group.x
-        base_y = base_config.get("y", 0) - base_group.y
+        base_config = bases_config.get(base_name, _EMPTY)
+        base_x = base_config.get("x", 0) - origin_x
+        base_y = base_config.get("y", 0) - origin_y
         
         # Determine color
         if base_name == "home":
-            color = hex_to_int(base_config.get("color", "0x444444"))
+            color = hex_to_int(base_config.get("color", HOME_PLATE_COLOR))
         else:
-            color_key = "color_on" if occupied else "color_off"
-            color = hex_to_int(base_config.get(color_key, "0xFFFFFF" if occupied else "0x222222"))
-        
-        # Create bitmap for this base
-        base_bitmap = displayio.Bitmap(base_size, base_size, 2)
-        base_palette = displayio.Palette(2)
-        base_palette[0] = 0x000000  # Transparent
-        base_palette[1] = color  # Base color
+            color = hex_to_int(base_config.get(_BASE_COLOR_KEYS[occupied], _BASE_COLOR_DEFAULTS[occupied]))
         
         # Draw a filled circle (well, a square in this case due to limited resolution)
-        for bx in range(base_size):
-            for by in range(base_size):
-                base_bitmap[bx, by] = 1
-        
-        # Create TileGrid for this base
-        base_grid = displayio.TileGrid(
-            base_bitmap,
-            pixel_shader=base_palette,
-            x=base_x - base_size // 2,  # Center the base at the specified coordinates
-            y=base_y - base_size // 2
+        base_rect = create_solid_rect(
+            color,
+            base_size,
+            base_size,
+            x=base_x - base_half,  # Center the base at the specified coordinates
+            y=base_y - base_half
         )
         
         # Add to the base group
-        base_group.append(base_grid)
+        base_group.append(base_rect)
     
     # Draw lines connecting the bases - simplified for smaller diamond
     # This requires more complex bitmap manipulation - simplified for now
@@ -225,58 +300,26 @@ def setup_game_day_display(game_data, layout_config):
     """Set up the display for game day using the layout configuration"""
     main_group = displayio.Group()
     
-    # Draw the logo border
-    draw_logo_border(main_group, layout_config)
-    
-    # --- Load Team Logo ---
-    try:
-        logo_config = layout_config["logo"]
-        logo_bitmap = displayio.OnDiskBitmap("/images/ATL.bmp")
-        logo_tilegrid = displayio.TileGrid(
-            logo_bitmap, 
-            pixel_shader=logo_bitmap.pixel_shader, 
-            x=logo_config["x"], 
-            y=logo_config["y"]
-        )
-        main_group.append(logo_tilegrid)
-    except Exception as e:
-        print("Error loading logo:", e)
+    # Draw the logo border and team logo
+    draw_logo_panel(main_group, layout_config)
     
     # --- Team Matchup Text ---
     try:
         team_display_config = layout_config["team_display"]
+        home_config = team_display_config["home_team"]
+        vs_config = team_display_config["vs_text"]
+        away_config = team_display_config["away_team"]
         
         # Home team - reduced scale for 7-pixel height
-        home_team_label = label.Label(
-            terminalio.FONT, 
-            text=game_data["home_team"], 
-            color=hex_to_int(team_display_config["home_team"]["color"]), 
-            x=team_display_config["home_team"]["x"], 
-            y=team_display_config["home_team"]["y"],
-            scale=1
-        )
+        home_team_label = create_layout_label(game_data["home_team"], home_config)
         main_group.append(home_team_label)
         
         # VS text
-        vs_label = label.Label(
-            terminalio.FONT, 
-            text="v", 
-            color=hex_to_int(team_display_config["vs_text"]["color"]), 
-            x=team_display_config["vs_text"]["x"], 
-            y=team_display_config["vs_text"]["y"],
-            scale=1
-        )
+        vs_label = create_layout_label("v", vs_config)
         main_group.append(vs_label)
         
         # Away team
-        away_team_label = label.Label(
-            terminalio.FONT, 
-            text=game_data["away_team"], 
-            color=hex_to_int(team_display_config["away_team"]["color"]), 
-            x=team_display_config["away_team"]["x"], 
-            y=team_display_config["away_team"]["y"],
-            scale=1
-        )
+        away_team_label = create_layout_label(game_data["away_team"], away_config)
         main_group.append(away_team_label)
         
     except Exception as e:
@@ -285,14 +328,7 @@ def setup_game_day_display(game_data, layout_config):
     # --- Inning ---
     try:
         inning_config = layout_config["inning"]
-        inning_label = label.Label(
-            terminalio.FONT, 
-            text=game_data["inning"], 
-            color=hex_to_int(inning_config["color"]), 
-            x=inning_config["x"], 
-            y=inning_config["y"],
-            scale=1
-        )
+        inning_label = create_layout_label(game_data["inning"], inning_config)
         main_group.append(inning_label)
     except Exception as e:
         print("Error creating inning:", e)
@@ -301,14 +337,7 @@ def setup_game_day_display(game_data, layout_config):
     try:
         score_config = layout_config["score"]
         score_text = f"{game_data['home_team']} {game_data['score_home']}-{game_data['score_away']} {game_data['away_team']}"
-        score_label = label.Label(
-            terminalio.FONT, 
-            text=score_text, 
-            color=hex_to_int(score_config["color"]), 
-            x=score_config["x"], 
-            y=score_config["y"],
-            scale=1
-        )
+        score_label = create_layout_label(score_text, score_config)
         main_group.append(score_label)
     except Exception as e:
         print("Error creating score:", e)
@@ -329,14 +358,7 @@ def setup_game_day_display(game_data, layout_config):
     try:
         count_config = layout_config["count"]
         count_text = f"B:{game_data['balls']} S:{game_data['strikes']} O:{game_data['outs']}"
-        count_label = label.Label(
-            terminalio.FONT, 
-            text=count_text, 
-            color=hex_to_int(count_config["color"]), 
-            x=count_config["x"], 
-            y=count_config["y"],
-            scale=1
-        )
+        count_label = create_layout_label(count_text, count_config)
         main_group.append(count_label)
     except Exception as e:
         print("Error creating count:", e)
@@ -347,33 +369,17 @@ def setup_off_day_display(team_data, layout_config):
     """Set up the display for off days using the layout configuration"""
     main_group = displayio.Group()
     
-    # Draw the logo border
-    draw_logo_border(main_group, layout_config)
-    
-    # Load the logo
-    try:
-        logo_config = layout_config["logo"]
-        logo_bitmap = displayio.OnDiskBitmap("/images/ATL.bmp")
-        logo_tilegrid = displayio.TileGrid(
-            logo_bitmap, 
-            pixel_shader=logo_bitmap.pixel_shader, 
-            x=logo_config["x"], 
-            y=logo_config["y"]
-        )
-        main_group.append(logo_tilegrid)
-    except Exception as e:
-        print("Error loading logo:", e)
+    # Draw the logo border and team logo
+    draw_logo_panel(main_group, layout_config)
     
     # Team name and record - adjusted for 7-pixel height
     try:
         team_record = f"{team_data['team']}: {team_data['wins']}-{team_data['losses']}"
-        record_label = label.Label(
-            terminalio.FONT,
-            text=team_record,
-            color=0x00FFFF,
-            x=19,
-            y=8,
-            scale=1
+        record_label = create_text_label(
+            team_record,
+            HIGHLIGHT_COLOR,
+            19,
+            8
         )
         main_group.append(record_label)
     except Exception as e:
@@ -382,25 +388,21 @@ def setup_off_day_display(team_data, layout_config):
     # Next game information
     try:
         next_game_text = f"NEXT: {team_data['next_date']}"
-        next_game_label = label.Label(
-            terminalio.FONT,
-            text=next_game_text,
-            color=0xFFFFFF,
-            x=19,
-            y=16,
-            scale=1
+        next_game_label = create_text_label(
+            next_game_text,
+            TEXT_COLOR,
+            19,
+            16
         )
         main_group.append(next_game_label)
         
         # Opponent
         opponent_text = f"vs {team_data['next_opponent']}"
-        opponent_label = label.Label(
-            terminalio.FONT,
-            text=opponent_text,
-            color=0x00FFFF,
-            x=19,
-            y=24,
-            scale=1
+        opponent_label = create_text_label(
+            opponent_text,
+            HIGHLIGHT_COLOR,
+            19,
+            24
         )
         main_group.append(opponent_label)
     except Exception as e:
@@ -22,6 +22,9 @@ GAMMA = 2.6
 MAX_WIDTH = 15  # Reduced from 24 to 15
 MAX_HEIGHT = 15  # Reduced from 24 to 15
 
+# ESPN endpoints
+ESPN_TEAMS_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams"
+
 PASSTHROUGH = ((0, 0, 0),
                (255, 0, 0),
                (255, 255, 0),
@@ -140,16 +143,17 @@ def apply_dithering(img, output_8_bit=True, passthrough=PASSTHROUGH):
 
 def get_team_logo(team_abbr="ATL"):
     """Download logo for specified MLB team."""
+    # One session keeps the ESPN connection alive across the lookups
+    session = requests.Session()
     try:
         # First try direct team URL with abbreviation
-        team_url = f"https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/{team_abbr.lower()}"
-        response = requests.get(team_url)
+        team_url = f"{ESPN_TEAMS_URL}/{team_abbr.lower()}"
+        response = session.get(team_url)
         
         # If team not found by abbreviation, search all teams
         if response.status_code != 200:
             print(f"Team {team_abbr} not found directly, searching all teams...")
-            all_teams_url = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams"
-            response = requests.get(all_teams_url)
+            response = session.get(ESPN_TEAMS_URL)
             data = response.json()
             
             teams = data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
@@ -175,7 +179,7 @@ def get_team_logo(team_abbr="ATL"):
         print(f"Found logo for {team_abbr}: {logo_url}")
         
         # Download the logo
-        img_response = requests.get(logo_url, stream=True)
+        img_response = session.get(logo_url, stream=True)
         if img_response.status_code != 200:
             print(f"Failed to download logo: HTTP {img_response.status_code}")
             return None
@@ -185,6 +189,8 @@ def get_team_logo(team_abbr="ATL"):
     except Exception as e:
         print(f"Error getting team logo: {e}")
         return None
+    finally:
+        session.close()
 
 def main():
     """Main function to download and process team logo."""